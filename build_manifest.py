@@ -0,0 +1,148 @@
+"""
+Manifiesto JSON de cada presentación generada
+
+Registra qué se construyó y cuánto costó: hash del contenido, layout,
+número de bullets, tamaño del XML y tiempo de cada slide, más los totales
+del paquete y el pico de memoria del proceso. Permite a la caché, la
+deduplicación y la planificación de capacidad razonar sobre una
+presentación sin abrir el .pptx.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+
+import pptx
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MANIFEST_VERSION = 1
+
+def content_hash(slide_spec):
+    """Hash estable del contenido de un slide de la especificación"""
+    canonical = json.dumps(slide_spec, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+def manifest_name(name):
+    """Nombre del manifiesto que acompaña a `name` (x.pptx -> x.manifest.json)"""
+    return os.path.splitext(name)[0] + ".manifest.json"
+
+def peak_rss_bytes():
+    """Pico de memoria residente del proceso, o None si no se puede medir
+
+    Es el pico de toda la vida del proceso: en los procesos de trabajo de
+    render_scheduler refleja la mayor presentación renderizada por ese
+    proceso hasta ahora, no solo la actual.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss está en KiB en Linux y en bytes en macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+class ManifestRecorder:
+    """Acumula métricas durante build_presentation (usar como on_slide)
+
+    También sirve como on_slide de update_presentation: tras cada
+    actualización incremental, rebase() reordena las entradas según la
+    presentación y descarta las de los slides eliminados.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.slides = []
+        self.timings = {}
+
+    def __call__(self, index, spec, slide, seconds):
+        kind = spec[0]
+        self.slides.append({
+            "index": index + 1,
+            "kind": kind,
+            "title": spec[1],
+            "content_hash": content_hash(spec),
+            "bullets": len(spec[2]) if kind == "content" else 0,
+            "build_ms": round(seconds * 1000, 3),
+            "_slide": slide,
+        })
+
+    def rebase(self, prs):
+        """Alinear las entradas con los slides actuales de prs"""
+        entries = {id(entry["_slide"].part): entry for entry in self.slides}
+        self.slides = []
+        for index, slide in enumerate(prs.slides):
+            entry = entries[id(slide.part)]
+            entry["index"] = index + 1
+            self.slides.append(entry)
+
+    def restart(self):
+        """Empezar a medir una nueva actualización (tiempos desde cero)"""
+        self.started = time.perf_counter()
+        self.timings = {}
+
+    def mark(self, phase, seconds):
+        """Registrar la duración de una fase (build, save, ...)"""
+        self.timings[f"{phase}_ms"] = round(seconds * 1000, 3)
+
+    def finish(self, prs, output=None, output_bytes=None, part_sizes=None):
+        """Construir el manifiesto; llamar después de guardar la presentación
+
+        part_sizes ({nombre de parte: bytes}) sustituye al tamaño del blob en
+        memoria cuando lo escrito difiere de él, como el XML minificado de
+        save_optimized.
+        """
+        part_sizes = part_sizes or {}
+        parts = {
+            str(part.partname): part_sizes.get(part.partname, len(part.blob))
+            for part in prs.part.package.iter_parts()
+        }
+        slides = []
+        for entry in self.slides:
+            slide = entry["_slide"]
+            entry = {key: value for key, value in entry.items() if key != "_slide"}
+            entry["layout"] = slide.slide_layout.name
+            entry["part"] = str(slide.part.partname)
+            entry["xml_bytes"] = parts[entry["part"]]
+            slides.append(entry)
+
+        deck_hash = hashlib.sha256(
+            "".join(entry["content_hash"] for entry in self.slides).encode()
+        ).hexdigest()
+
+        self.timings["total_ms"] = round((time.perf_counter() - self.started) * 1000, 3)
+        return {
+            "manifest_version": MANIFEST_VERSION,
+            "output": output,
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "generator": {
+                "python": sys.version.split()[0],
+                "python_pptx": pptx.__version__,
+            },
+            "deck_hash": deck_hash,
+            "totals": {
+                "slides": len(self.slides),
+                "bullets": sum(entry["bullets"] for entry in self.slides),
+                "slides_by_kind": _count_by(self.slides, "kind"),
+                "parts": len(parts),
+                "part_bytes": sum(parts.values()),
+                "output_bytes": output_bytes,
+                "peak_rss_bytes": peak_rss_bytes(),
+            },
+            "timings": dict(self.timings),
+            "slides": slides,
+            "parts": dict(sorted(parts.items())),
+        }
+
+def _count_by(entries, key):
+    counts = {}
+    for entry in entries:
+        counts[entry[key]] = counts.get(entry[key], 0) + 1
+    return counts
+
+def write_manifest(manifest, f):
+    """Escribir el manifiesto en un stream binario"""
+    f.write(json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8"))
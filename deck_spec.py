@@ -0,0 +1,20 @@
+"""
+Utilidades para leer especificaciones de presentación (listas SLIDES)
+
+No depende de python-pptx, de modo que las herramientas que solo analizan el
+contenido (lint, localización, manifiestos) no pagan su importación.
+"""
+
+import runpy
+
+def load_slides(spec_path):
+    """Ejecutar el archivo de contenido y devolver su lista SLIDES"""
+    return runpy.run_path(spec_path)["SLIDES"]
+
+def iter_points(content_points):
+    """Normalizar los bullets de un slide de contenido a pares (texto, nivel)"""
+    for point in content_points:
+        if isinstance(point, tuple):
+            yield point
+        else:
+            yield point, 0
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Lint de especificaciones de presentación antes de renderizarlas
+
+Revisa la secuencia de slides title/section/content de uno o varios archivos
+de contenido sin importar python-pptx. Las reglas son configurables con un
+JSON del estilo:
+
+    {"rules": {"max_bullets": {"max": 10},
+               "max_level": {"max": 4},
+               "bullet_length": "off"}}
+
+Uso:
+    python lint_deck.py [deck_content.py ...] [--config lint.json] [--format json]
+
+Sale con código 1 si hay errores (o avisos con --strict), así que sirve
+directamente como gate de cada commit.
+"""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import sys
+import time
+
+from deck_spec import iter_points, load_slides
+
+SEVERITIES = ("error", "warning")
+SLIDE_ARITY = {"title": 3, "section": 2, "content": 3}
+
+# nombre -> (función, opciones por defecto)
+RULES = {}
+
+def rule(name, severity="error", **options):
+    """Registrar una regla: func(slides, options) -> [(índice, mensaje), ...]"""
+    def decorator(func):
+        RULES[name] = (func, dict(options, severity=severity))
+        return func
+    return decorator
+
+def _valid(slides):
+    """Slides bien formados, con su índice original"""
+    for i, slide in enumerate(slides):
+        if _structure_error(slide) is None:
+            yield i, slide
+
+def _structure_error(slide):
+    if not isinstance(slide, tuple) or not slide:
+        return "cada slide debe ser una tupla (tipo, título, ...)"
+    kind = slide[0]
+    if kind not in SLIDE_ARITY:
+        return f"tipo de slide desconocido: {kind!r}"
+    if len(slide) != SLIDE_ARITY[kind] and not (kind == "title" and len(slide) == 2):
+        return f"un slide {kind!r} espera {SLIDE_ARITY[kind]} elementos, tiene {len(slide)}"
+    if not all(isinstance(arg, str) for arg in slide[1:3] if kind != "content"):
+        return "el título y el subtítulo deben ser texto"
+    if kind == "content":
+        if not isinstance(slide[1], str) or not isinstance(slide[2], (list, tuple)):
+            return "un slide de contenido es (\"content\", título, [bullets])"
+        for point in slide[2]:
+            if isinstance(point, tuple):
+                if (len(point) != 2 or not isinstance(point[0], str)
+                        or not isinstance(point[1], int)):
+                    return f"bullet inválido {point!r}: se espera (texto, nivel)"
+            elif not isinstance(point, str):
+                return f"bullet inválido {point!r}"
+    return None
+
+@rule("structure")
+def check_structure(slides, options):
+    for i, slide in enumerate(slides):
+        error = _structure_error(slide)
+        if error:
+            yield i, error
+
+@rule("first_slide_title")
+def check_first_slide_title(slides, options):
+    if slides and isinstance(slides[0], tuple) and slides[0][:1] != ("title",):
+        yield 0, "la presentación debe empezar con un slide de título"
+
+@rule("empty_title")
+def check_empty_title(slides, options):
+    for i, slide in _valid(slides):
+        if not slide[1].strip():
+            yield i, "título vacío"
+
+@rule("duplicate_title")
+def check_duplicate_title(slides, options):
+    seen = {}
+    for i, slide in _valid(slides):
+        key = " ".join(slide[1].split()).casefold()
+        if key and key in seen:
+            yield i, f"título duplicado del slide {seen[key] + 1}: {slide[1]!r}"
+        seen.setdefault(key, i)
+
+@rule("title_length", severity="warning", max=60)
+def check_title_length(slides, options):
+    for i, slide in _valid(slides):
+        if len(slide[1]) > options["max"]:
+            yield i, f"título de {len(slide[1])} caracteres (máximo {options['max']})"
+
+@rule("empty_content")
+def check_empty_content(slides, options):
+    for i, slide in _valid(slides):
+        if slide[0] == "content" and not slide[2]:
+            yield i, "slide de contenido sin bullets"
+
+# Un slide de 15 bullets o más está sobrecargado: es un error, no un aviso
+@rule("max_bullets", max=14)
+def check_max_bullets(slides, options):
+    for i, slide in _valid(slides):
+        if slide[0] == "content" and len(slide[2]) > options["max"]:
+            yield i, f"{len(slide[2])} bullets (máximo {options['max']})"
+
+# El cuerpo del layout de contenido de la plantilla por defecto define
+# lvl1pPr-lvl9pPr (niveles 0-8), el mismo rango que acepta python-pptx al
+# asignar paragraph.level; con plantillas de menos niveles, bajarlo por config
+@rule("max_level", max=8)
+def check_max_level(slides, options):
+    for i, slide in _valid(slides):
+        if slide[0] != "content":
+            continue
+        for text, level in iter_points(slide[2]):
+            if not 0 <= level <= options["max"]:
+                yield i, f"nivel {level} fuera de rango 0-{options['max']}: {text!r}"
+
+@rule("level_jump", severity="warning")
+def check_level_jump(slides, options):
+    for i, slide in _valid(slides):
+        if slide[0] != "content":
+            continue
+        previous = -1
+        for text, level in iter_points(slide[2]):
+            if level > previous + 1:
+                yield i, f"salto de nivel {previous if previous >= 0 else '-'} → {level}: {text!r}"
+            previous = level
+
+@rule("empty_bullet")
+def check_empty_bullet(slides, options):
+    for i, slide in _valid(slides):
+        if slide[0] == "content":
+            for text, _ in iter_points(slide[2]):
+                if not text.strip():
+                    yield i, "bullet vacío"
+
+@rule("bullet_length", severity="warning", max=90)
+def check_bullet_length(slides, options):
+    for i, slide in _valid(slides):
+        if slide[0] == "content":
+            for text, _ in iter_points(slide[2]):
+                if len(text) > options["max"]:
+                    yield i, f"bullet de {len(text)} caracteres (máximo {options['max']}): {text[:40]!r}…"
+
+@rule("empty_section", severity="warning")
+def check_empty_section(slides, options):
+    kinds = [slide[0] if isinstance(slide, tuple) and slide else None for slide in slides]
+    for i, kind in enumerate(kinds):
+        if kind == "section" and (i + 1 == len(kinds) or kinds[i + 1] in ("section", "title")):
+            yield i, "sección sin slides de contenido"
+
+def resolve_rules(config=None):
+    """Combinar las opciones por defecto con la configuración del usuario
+
+    Devuelve {nombre: opciones} solo con las reglas activas.
+    """
+    overrides = (config or {}).get("rules", {})
+    unknown = set(overrides) - set(RULES)
+    if unknown:
+        raise ValueError(f"reglas desconocidas: {', '.join(sorted(unknown))}")
+
+    active = {}
+    for name, (_, defaults) in RULES.items():
+        override = overrides.get(name, {})
+        if override in ("off", False):
+            continue
+        if isinstance(override, str):
+            override = {"severity": override}
+        options = dict(defaults, **override)
+        if options["severity"] not in SEVERITIES:
+            raise ValueError(f"severidad inválida en {name}: {options['severity']!r}")
+        active[name] = options
+    return active
+
+def lint_slides(slides, rules, path="<slides>"):
+    """Aplicar las reglas activas a una lista SLIDES"""
+    results = []
+    for name, options in rules.items():
+        func = RULES[name][0]
+        for index, message in func(slides, options):
+            slide = slides[index]
+            title = slide[1] if isinstance(slide, tuple) and len(slide) > 1 else None
+            results.append({
+                "file": path,
+                "slide": index + 1,
+                "title": title,
+                "rule": name,
+                "severity": options["severity"],
+                "message": message,
+            })
+    results.sort(key=lambda r: (r["slide"], r["rule"]))
+    return results
+
+def lint_file(path, rules):
+    """Cargar un archivo de contenido y devolver sus resultados de lint"""
+    try:
+        slides = load_slides(path)
+    except Exception as e:
+        return [{"file": path, "slide": None, "title": None, "rule": "load",
+                 "severity": "error", "message": f"{type(e).__name__}: {e}"}]
+    if not isinstance(slides, list):
+        return [{"file": path, "slide": None, "title": None, "rule": "load",
+                 "severity": "error", "message": "SLIDES debe ser una lista"}]
+    return lint_slides(slides, rules, path)
+
+def lint_files(paths, rules, jobs=None):
+    """Lint de varios archivos en paralelo con un pool de procesos"""
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(paths) < 2:
+        return [r for path in paths for r in lint_file(path, rules)]
+    with concurrent.futures.ProcessPoolExecutor(min(jobs, len(paths))) as pool:
+        chunks = pool.map(lint_file, paths, [rules] * len(paths),
+                          chunksize=max(1, len(paths) // (jobs * 4)))
+        return [r for chunk in chunks for r in chunk]
+
+def main():
+    parser = argparse.ArgumentParser(description="Lint de especificaciones de presentación")
+    parser.add_argument("specs", nargs="*",
+                        default=[os.path.join(os.path.dirname(__file__), "deck_content.py")],
+                        help="archivos de contenido con la lista SLIDES")
+    parser.add_argument("--config", help="JSON con la configuración de reglas")
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    parser.add_argument("--jobs", type=int, help="procesos en paralelo (por defecto, CPUs)")
+    parser.add_argument("--strict", action="store_true", help="fallar también con avisos")
+    args = parser.parse_args()
+
+    config = None
+    if args.config:
+        with open(args.config, encoding="utf-8") as f:
+            config = json.load(f)
+    rules = resolve_rules(config)
+
+    start = time.perf_counter()
+    results = lint_files(args.specs, rules, args.jobs)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    summary = {severity: sum(r["severity"] == severity for r in results)
+               for severity in SEVERITIES}
+    if args.format == "json":
+        json.dump({"files": len(args.specs), "elapsed_ms": round(elapsed_ms, 1),
+                   "summary": summary, "results": results},
+                  sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        for r in results:
+            where = f"{r['file']}:slide {r['slide']}" if r["slide"] else r["file"]
+            print(f"{where}: {r['severity']} [{r['rule']}] {r['message']}")
+        print(f"🔎 {len(args.specs)} archivo(s), {summary['error']} errores, "
+              f"{summary['warning']} avisos ({elapsed_ms:.1f} ms)")
+
+    failed = summary["error"] or (args.strict and summary["warning"])
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
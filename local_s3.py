@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Servidor mínimo compatible con S3 para desarrollo y pruebas de S3Sink
+
+Implementa en memoria PUT/GET de objetos y el ciclo multipart
+(CreateMultipartUpload, UploadPart, CompleteMultipartUpload y
+AbortMultipartUpload). No valida firmas.
+
+Uso:
+    python local_s3.py [--port 9000]
+    AWS_ENDPOINT_URL=http://127.0.0.1:9000 python create_presentation.py --output s3://decks/ia.pptx
+"""
+
+import argparse
+import hashlib
+import http.server
+import threading
+import urllib.parse
+import uuid
+from xml.etree import ElementTree
+
+class LocalS3Server(http.server.ThreadingHTTPServer):
+    """Servidor S3 en memoria; los objetos quedan en `objects[(bucket, clave)]`"""
+
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0)):
+        super().__init__(address, _Handler)
+        self.objects = {}
+        self.uploads = {}
+        self.lock = threading.Lock()
+
+    @property
+    def endpoint(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Atender peticiones en un hilo de fondo"""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _target(self):
+        url = urllib.parse.urlsplit(self.path)
+        bucket, _, key = urllib.parse.unquote(url.path).lstrip("/").partition("/")
+        return (bucket, key), dict(urllib.parse.parse_qsl(url.query, keep_blank_values=True))
+
+    def _body(self):
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def _reply(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_PUT(self):
+        target, query = self._target()
+        body = self._body()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        with self.server.lock:
+            if "uploadId" in query:
+                parts = self.server.uploads.get(query["uploadId"])
+                if parts is None:
+                    return self._reply(404)
+                parts[int(query["partNumber"])] = (etag, body)
+            else:
+                self.server.objects[target] = body
+        self._reply(200, headers={"ETag": etag})
+
+    def do_POST(self):
+        target, query = self._target()
+        body = self._body()
+        if "uploads" in query:
+            upload_id = uuid.uuid4().hex
+            with self.server.lock:
+                self.server.uploads[upload_id] = {}
+            xml = (f"<InitiateMultipartUploadResult><Bucket>{target[0]}</Bucket>"
+                   f"<Key>{target[1]}</Key><UploadId>{upload_id}</UploadId>"
+                   f"</InitiateMultipartUploadResult>")
+            return self._reply(200, xml.encode())
+
+        with self.server.lock:
+            parts = self.server.uploads.pop(query.get("uploadId"), None)
+        if parts is None:
+            return self._reply(404)
+        requested = [
+            (int(p.findtext("PartNumber")), p.findtext("ETag"))
+            for p in ElementTree.fromstring(body).iter("Part")
+        ]
+        if any(parts.get(number, (None,))[0] != etag for number, etag in requested):
+            return self._reply(400, b"<Error><Code>InvalidPart</Code></Error>")
+        with self.server.lock:
+            self.server.objects[target] = b"".join(parts[n][1] for n, _ in requested)
+        self._reply(200, f"<CompleteMultipartUploadResult><Key>{target[1]}</Key>"
+                         f"</CompleteMultipartUploadResult>".encode())
+
+    def do_DELETE(self):
+        target, query = self._target()
+        with self.server.lock:
+            if "uploadId" in query:
+                self.server.uploads.pop(query["uploadId"], None)
+            else:
+                self.server.objects.pop(target, None)
+        self._reply(204)
+
+    def do_GET(self):
+        target, _ = self._target()
+        body = self.server.objects.get(target)
+        if body is None:
+            return self._reply(404)
+        self._reply(200, body)
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor S3 local en memoria")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    args = parser.parse_args()
+
+    server = LocalS3Server((args.host, args.port))
+    print(f"🪣 S3 local en {server.endpoint}, Ctrl+C para salir")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Localización de presentaciones con memoria de traducción
+
+Extrae los textos únicos de la especificación (títulos, subtítulos y
+bullets), traduce con el backend configurado solo los que no estén ya en la
+memoria de traducción y renderiza una variante por idioma en la misma
+ejecución. La memoria se guarda en un JSON, de modo que los textos repetidos
+entre slides y entre presentaciones se traducen una sola vez.
+
+Uso:
+    python localize_deck.py --targets en,pt [--spec deck_content.py]
+        [--memory translation_memory.json] [--translator stub|modulo:Clase]
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+
+from deck_spec import iter_points, load_slides
+from output_sinks import create_temp
+
+class Translator:
+    """Backend de traducción: traduce un lote de textos de `source` a `target`"""
+
+    def translate(self, texts, source, target):
+        """Devolver la lista de traducciones, en el mismo orden que `texts`"""
+        raise NotImplementedError
+
+class StubTranslator(Translator):
+    """Traductor local para pruebas: marca cada texto con el idioma destino"""
+
+    def __init__(self):
+        self.calls = 0
+        self.translated = 0
+
+    def translate(self, texts, source, target):
+        self.calls += 1
+        self.translated += len(texts)
+        return [f"[{target}] {text}" for text in texts]
+
+TRANSLATORS = {"stub": StubTranslator}
+
+def load_translator(name):
+    """Instanciar un backend por nombre registrado o como 'modulo:Clase'"""
+    if name in TRANSLATORS:
+        return TRANSLATORS[name]()
+    module_name, sep, class_name = name.partition(":")
+    if not sep:
+        raise ValueError(f"traductor desconocido: {name!r} (usar 'modulo:Clase')")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+class TranslationMemory:
+    """Memoria de traducción persistente en un archivo JSON
+
+    Cada entrada se indexa por idiomas y hash del texto original, así que
+    un texto modificado se trata como nuevo y uno repetido no se vuelve a
+    traducir.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._entries = {}
+        self._dirty = False
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self._entries = json.load(f).get("entries", {})
+
+    @staticmethod
+    def key(text, source, target):
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{source}:{target}:{digest}"
+
+    def get(self, text, source, target):
+        entry = self._entries.get(self.key(text, source, target))
+        if entry is not None and entry["source"] == text:
+            return entry["target"]
+        return None
+
+    def put(self, text, source, target, translation):
+        self._entries[self.key(text, source, target)] = {
+            "source": text, "target": translation,
+        }
+        self._dirty = True
+
+    def __len__(self):
+        return len(self._entries)
+
+    def save(self):
+        """Escribir la memoria de forma atómica si ha cambiado"""
+        if not self.path or not self._dirty:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        # Con los permisos de open() y no los 0600 de mkstemp: es compartida
+        fd, tmp_path = create_temp(directory, ".json.tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "entries": self._entries}, f,
+                          ensure_ascii=False, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._dirty = False
+
+def iter_texts(slides):
+    """Todos los textos traducibles de una especificación"""
+    for kind, *args in slides:
+        yield args[0]
+        if kind == "title" and len(args) > 1 and args[1]:
+            yield args[1]
+        elif kind == "content":
+            for text, _ in iter_points(args[1]):
+                yield text
+
+def translate_texts(texts, memory, translator, source, target, batch_size=100):
+    """Traducir los textos que falten en la memoria; devuelve {texto: traducción}"""
+    unique = list(dict.fromkeys(text for text in texts if text.strip()))
+    result = {}
+    missing = []
+    for text in unique:
+        cached = memory.get(text, source, target)
+        if cached is None:
+            missing.append(text)
+        else:
+            result[text] = cached
+
+    for i in range(0, len(missing), batch_size):
+        batch = missing[i:i + batch_size]
+        translations = translator.translate(batch, source, target)
+        if len(translations) != len(batch):
+            raise ValueError(f"el traductor devolvió {len(translations)} textos para {len(batch)}")
+        for text, translation in zip(batch, translations):
+            memory.put(text, source, target, translation)
+            result[text] = translation
+
+    return result, {"unique": len(unique), "hits": len(unique) - len(missing),
+                    "translated": len(missing)}
+
+def localize_slides(slides, translations):
+    """Copia de la especificación con los textos sustituidos"""
+    def tr(text):
+        return translations.get(text, text)
+
+    localized = []
+    for kind, *args in slides:
+        if kind == "content":
+            title, points = args
+            localized.append((kind, tr(title), [
+                (tr(point[0]), point[1]) if isinstance(point, tuple) else tr(point)
+                for point in points
+            ]))
+        else:
+            localized.append((kind, *map(tr, args)))
+    return localized
+
+def localized_output(output, target):
+    """deck.pptx -> deck_en.pptx"""
+    stem, ext = os.path.splitext(output)
+    return f"{stem}_{target}{ext}"
+
+def localize_deck(slides, targets, memory, translator, source="es"):
+    """Localizar una especificación a varios idiomas
+
+    Devuelve {idioma: (slides, estadísticas)}.
+    """
+    texts = list(iter_texts(slides))
+    variants = {}
+    for target in targets:
+        translations, stats = translate_texts(texts, memory, translator, source, target)
+        variants[target] = (localize_slides(slides, translations), stats)
+    return variants
+
+def main():
+    from create_presentation import OUTPUT_PATH, render_deck
+
+    parser = argparse.ArgumentParser(description="Generar variantes localizadas de la presentación")
+    parser.add_argument("--spec", default=os.path.join(os.path.dirname(__file__), "deck_content.py"),
+                        help="archivo de contenido con la lista SLIDES")
+    parser.add_argument("--targets", required=True, help="idiomas destino separados por comas")
+    parser.add_argument("--source", default="es", help="idioma del contenido original")
+    parser.add_argument("--memory", default="translation_memory.json",
+                        help="archivo de la memoria de traducción")
+    parser.add_argument("--translator", default="stub",
+                        help="backend: 'stub' o 'modulo:Clase'")
+    parser.add_argument("--output", default=OUTPUT_PATH,
+                        help="ruta base; cada idioma añade el sufijo _<idioma>")
+    parser.add_argument("--optimize", action="store_true")
+    parser.add_argument("--baseline", action="store_true",
+                        help="con --optimize, comparar con un guardado normal (un save extra)")
+    parser.add_argument("--no-manifest", dest="manifest", action="store_false")
+    args = parser.parse_args()
+
+    targets = [t.strip() for t in args.targets.split(",") if t.strip()]
+    memory = TranslationMemory(args.memory)
+    translator = load_translator(args.translator)
+
+    slides = load_slides(args.spec)
+    try:
+        variants = localize_deck(slides, targets, memory, translator, args.source)
+    finally:
+        memory.save()
+
+    for target, (localized, stats) in variants.items():
+        output = localized_output(args.output, target)
+        summary = render_deck(localized, output, optimize=args.optimize,
+                              baseline=args.baseline, manifest=args.manifest)
+        print(f"🌐 {target}: {stats['unique']} textos únicos, {stats['hits']} en memoria, "
+              f"{stats['translated']} traducidos → {os.path.basename(output)} "
+              f"({summary['slides']} slides)")
+    print(f"📚 Memoria de traducción: {len(memory)} entradas ({args.memory})")
+
+if __name__ == "__main__":
+    main()
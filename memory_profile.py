@@ -0,0 +1,194 @@
+"""
+Perfilado de memoria de la generación de presentaciones
+
+Modo opcional que activa tracemalloc y registra, en cada frontera de slide
+y alrededor del guardado, la memoria trazada, el pico y el RSS del
+proceso. Atribuye la memoria a la función constructora y al tipo de slide,
+y lanza MemoryBudgetExceeded en cuanto se supera un presupuesto por slide o
+de pico, para detectar regresiones antes de desplegar.
+"""
+
+import contextlib
+import os
+import time
+import tracemalloc
+
+from build_manifest import peak_rss_bytes
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# Las reservas del propio perfilador no se atribuyen a ningún slide
+_OWN_FRAMES = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+]
+
+class MemoryBudgetExceeded(Exception):
+    """Se superó un presupuesto de memoria configurado"""
+
+def current_rss_bytes():
+    """RSS actual del proceso (en Linux vía /proc; si no, el pico)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return peak_rss_bytes()
+
+class MemoryProfiler:
+    """Registra memoria por slide y por fase; usar como on_slide de build_presentation
+
+    slide_budget limita la memoria trazada que un slide puede llegar a
+    reservar (pico durante su construcción); peak_budget limita el pico de
+    RSS del proceso. Ambos en bytes; None desactiva el límite. El primer
+    slide de cada tipo paga además el parseo perezoso de su layout en la
+    plantilla: se marca como warmup y no cuenta para slide_budget.
+    builders es el mapa tipo -> función constructora (SLIDE_BUILDERS) con
+    el que se atribuye cada slide; sin él se usa el tipo.
+
+    En cada slide solo se leen los contadores de tracemalloc, que no
+    dependen del número de reservas vivas. Las líneas que más memoria
+    retienen (top_sites) requieren un snapshot completo, así que solo se
+    calculan en las fases, al superar un presupuesto y, con snapshot_every,
+    cada N slides; abarcan desde el snapshot anterior.
+    """
+
+    def __init__(self, slide_budget=None, peak_budget=None, frames=1, top=5,
+                 builders=None, snapshot_every=None):
+        self.slide_budget = slide_budget
+        self.peak_budget = peak_budget
+        self.frames = frames
+        self.top = top
+        self.builders = builders or {}
+        self.snapshot_every = snapshot_every
+        self.slides = []
+        self.phases = {}
+        self._started_tracing = False
+        self._snapshot = None
+        self._boundary = 0
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        self._snapshot = self._take_snapshot()
+        self._mark_boundary()
+        return self
+
+    def stop(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._snapshot = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(_OWN_FRAMES)
+
+    def _mark_boundary(self):
+        self._boundary = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def _top_sites(self):
+        """Líneas de código que más memoria retienen desde el último snapshot"""
+        snapshot = self._take_snapshot()
+        stats = snapshot.compare_to(self._snapshot, "lineno")
+        self._snapshot = snapshot
+        return [
+            {"site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+             "size_diff": stat.size_diff, "count_diff": stat.count_diff}
+            for stat in stats[:self.top] if stat.size_diff > 0
+        ]
+
+    def __call__(self, index, spec, slide, seconds):
+        kind = spec[0]
+        builder = self.builders.get(kind)
+        current, peak = tracemalloc.get_traced_memory()
+        entry = {
+            "index": index + 1,
+            "kind": kind,
+            "builder": builder.__name__ if builder else kind,
+            "warmup": all(s["kind"] != kind for s in self.slides),
+            "title": spec[1],
+            "retained_bytes": current - self._boundary,
+            "peak_bytes": peak - self._boundary,
+            "traced_bytes": current,
+            "rss_bytes": current_rss_bytes(),
+        }
+        self.slides.append(entry)
+
+        over_budget = (self.slide_budget is not None and not entry["warmup"]
+                       and entry["peak_bytes"] > self.slide_budget)
+        if over_budget or (self.snapshot_every and entry["index"] % self.snapshot_every == 0):
+            entry["top_sites"] = self._top_sites()
+        self._mark_boundary()
+
+        if over_budget:
+            raise MemoryBudgetExceeded(
+                f"slide {entry['index']} ({entry['builder']}) reservó "
+                f"{entry['peak_bytes']} bytes, presupuesto {self.slide_budget}"
+            )
+        self._check_peak(f"slide {entry['index']}")
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Medir una fase (por ejemplo el guardado) entre dos fronteras"""
+        self._snapshot = None
+        self._snapshot = self._take_snapshot()
+        self._mark_boundary()
+        rss_before = current_rss_bytes()
+        start = time.perf_counter()
+        yield
+        current, peak = tracemalloc.get_traced_memory()
+        self.phases[name] = {
+            "ms": (time.perf_counter() - start) * 1000,
+            "retained_bytes": current - self._boundary,
+            "peak_bytes": peak - self._boundary,
+            "rss_before_bytes": rss_before,
+            "rss_after_bytes": current_rss_bytes(),
+            "top_sites": self._top_sites(),
+        }
+        self._mark_boundary()
+        self._check_peak(name)
+
+    def _check_peak(self, where):
+        if self.peak_budget is None:
+            return
+        peak = peak_rss_bytes()
+        if peak is not None and peak > self.peak_budget:
+            raise MemoryBudgetExceeded(
+                f"pico de RSS {peak} bytes tras {where}, presupuesto {self.peak_budget}"
+            )
+
+    def report(self):
+        """Resumen por slide, por constructor, por tipo de slide y por fase"""
+        return {
+            "slide_budget": self.slide_budget,
+            "peak_budget": self.peak_budget,
+            "peak_rss_bytes": peak_rss_bytes(),
+            "peak_traced_bytes": max((s["traced_bytes"] for s in self.slides), default=0),
+            "by_builder": _aggregate(self.slides, "builder"),
+            "by_kind": _aggregate(self.slides, "kind"),
+            "phases": self.phases,
+            "slides": self.slides,
+        }
+
+def _aggregate(slides, key):
+    groups = {}
+    for entry in slides:
+        group = groups.setdefault(entry[key], {
+            "slides": 0, "retained_bytes": 0, "max_peak_bytes": 0,
+            "warmup_peak_bytes": 0,
+        })
+        group["slides"] += 1
+        group["retained_bytes"] += entry["retained_bytes"]
+        # El pico del primer slide de cada tipo va aparte (ver MemoryProfiler)
+        field = "warmup_peak_bytes" if entry["warmup"] else "max_peak_bytes"
+        group[field] = max(group[field], entry["peak_bytes"])
+    for group in groups.values():
+        group["mean_retained_bytes"] = group["retained_bytes"] // group["slides"]
+    return groups
@@ -0,0 +1,172 @@
+"""
+Guardado optimizado de presentaciones
+
+Reduce el tamaño del .pptx eliminando layouts sin usar y partes a las que
+nada hace referencia, minificando el XML y aplicando un nivel de compresión
+configurable por parte del paquete.
+"""
+
+import fnmatch
+import io
+import time
+import zipfile
+
+from lxml import etree
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+# Partes que la plantilla por defecto incluye pero que PowerPoint no necesita
+OPTIONAL_RELTYPES = (RT.PRINTER_SETTINGS, RT.THUMBNAIL)
+
+# Perfiles de compresión: lista de (patrón glob, nivel). El nivel es
+# "stored" (sin comprimir) o un entero 0-9 de deflate. Gana el primer patrón
+# que coincida con el nombre de la parte.
+COMPRESSION_PROFILES = {
+    "stored": [("*", "stored")],
+    "fast": [("*.jpeg", "stored"), ("*.png", "stored"), ("*", 1)],
+    "default": [("*.jpeg", "stored"), ("*.png", "stored"), ("*", 6)],
+    "max": [("*", 9)],
+}
+
+# Elementos cuyo texto es contenido y no debe tocarse al minificar
+_TEXT_TAGS = {
+    "{http://schemas.openxmlformats.org/drawingml/2006/main}t",
+    "{http://schemas.openxmlformats.org/presentationml/2006/main}text",
+}
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+def parse_compression(spec):
+    """Convertir un perfil o una lista "patrón=nivel,..." en reglas de compresión
+
+    Ejemplo: "ppt/slides/*=9,*.jpeg=stored,*=6"
+    """
+    if spec in COMPRESSION_PROFILES:
+        return COMPRESSION_PROFILES[spec]
+
+    rules = []
+    for item in spec.split(","):
+        pattern, sep, level = item.strip().rpartition("=")
+        if not sep or not pattern:
+            raise ValueError(f"regla de compresión inválida: {item!r}")
+        if level != "stored":
+            level = int(level)
+            if not 0 <= level <= 9:
+                raise ValueError(f"nivel de compresión fuera de rango: {item!r}")
+        rules.append((pattern, level))
+    rules.append(("*", 6))
+    return rules
+
+def compression_for(name, rules):
+    """Devolver (compress_type, compresslevel) para la parte `name`"""
+    for pattern, level in rules:
+        if fnmatch.fnmatchcase(name, pattern):
+            if level == "stored":
+                return zipfile.ZIP_STORED, None
+            return zipfile.ZIP_DEFLATED, level
+    return zipfile.ZIP_DEFLATED, 6
+
+def prune_presentation(prs):
+    """Eliminar layouts y masters sin slides y partes opcionales sin referencias
+
+    Al guardar, python-pptx solo escribe las partes alcanzables por
+    relaciones, así que basta con cortar la relación. Devuelve la lista de
+    nombres de parte eliminados.
+    """
+    removed = []
+
+    for master in prs.slide_masters:
+        for layout in list(master.slide_layouts):
+            if not layout.used_by_slides:
+                removed.append(str(layout.part.partname))
+                master.slide_layouts.remove(layout)
+
+    # Masters que se quedaron sin layouts; el formato exige conservar uno
+    sldMasterIdLst = prs.slide_masters._sldMasterIdLst
+    for sldMasterId in list(sldMasterIdLst):
+        master = prs.part.related_part(sldMasterId.rId)
+        if len(master.slide_master.slide_layouts) == 0 and len(sldMasterIdLst) > 1:
+            removed.append(str(master.partname))
+            sldMasterIdLst.remove(sldMasterId)
+            prs.part.drop_rel(sldMasterId.rId)
+
+    package = prs.part.package
+    for source, rels in ((prs.part, prs.part.rels), (package, package._rels)):
+        for rId, rel in list(rels.items()):
+            if rel.reltype in OPTIONAL_RELTYPES:
+                removed.append(str(rel.target_partname))
+                source.drop_rel(rId)
+
+    return removed
+
+def minify_xml(blob):
+    """Quitar espacios en blanco entre elementos sin tocar el texto de los runs"""
+    root = etree.fromstring(blob)
+    for elm in root.iter():
+        if not isinstance(elm.tag, str):
+            continue
+        preserve = elm.tag in _TEXT_TAGS or elm.get(_XML_SPACE) == "preserve"
+        if not preserve and len(elm) and elm.text is not None and not elm.text.strip():
+            elm.text = None
+        if elm.tail is not None and not elm.tail.strip():
+            elm.tail = None
+    return etree.tostring(root, encoding="UTF-8", standalone=True)
+
+def repack(blob, compression="default", minify=True):
+    """Reescribir un paquete .pptx con XML minificado y compresión por parte"""
+    rules = parse_compression(compression) if isinstance(compression, str) else compression
+    out = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(blob)) as src, zipfile.ZipFile(out, "w") as dst:
+        for info in src.infolist():
+            data = src.read(info)
+            if minify and (info.filename.endswith(".xml") or info.filename.endswith(".rels")):
+                data = minify_xml(data)
+            zinfo = zipfile.ZipInfo(info.filename, info.date_time)
+            zinfo.compress_type, level = compression_for(info.filename, rules)
+            dst.writestr(zinfo, data, compresslevel=level)
+    return out.getvalue()
+
+def save_optimized(prs, file, compression="default", minify=True, prune=True,
+                   baseline=False):
+    """Guardar `prs` optimizado en `file` (ruta o stream binario)
+
+    Devuelve un dict con el tamaño y tiempo del guardado, las partes
+    eliminadas, el tamaño sin comprimir de cada parte ya minificada y, si
+    `baseline` es True, la comparación con un guardado normal (que cuesta
+    un save extra en memoria).
+    """
+    if baseline:
+        start = time.perf_counter()
+        plain = io.BytesIO()
+        prs.save(plain)
+        plain_seconds = time.perf_counter() - start
+        plain_bytes = len(plain.getvalue())
+
+    start = time.perf_counter()
+    removed = prune_presentation(prs) if prune else []
+    packed = io.BytesIO()
+    prs.save(packed)
+    data = repack(packed.getvalue(), compression, minify)
+    optimized_seconds = time.perf_counter() - start
+
+    if isinstance(file, str):
+        with open(file, "wb") as f:
+            f.write(data)
+    else:
+        file.write(data)
+
+    with zipfile.ZipFile(io.BytesIO(data)) as packed:
+        part_bytes = {"/" + info.filename: info.file_size for info in packed.infolist()}
+
+    report = {
+        "optimized_bytes": len(data),
+        "optimized_save_ms": optimized_seconds * 1000,
+        "removed_parts": removed,
+        "part_bytes": part_bytes,
+    }
+    if baseline:
+        report.update({
+            "plain_bytes": plain_bytes,
+            "bytes_saved": plain_bytes - len(data),
+            "plain_save_ms": plain_seconds * 1000,
+            "extra_save_ms": (optimized_seconds - plain_seconds) * 1000,
+        })
+    return report
@@ -0,0 +1,361 @@
+"""
+Destinos de salida para las presentaciones generadas
+
+Un sink entrega un stream binario en el que escribir el .pptx (por ejemplo
+con prs.save) y se encarga de publicarlo al cerrarlo:
+
+    sink = sink_for("s3://bucket/decks/ia.pptx")
+    with sink.open("decks/ia.pptx") as f:
+        prs.save(f)
+
+Los sinks se pueden reutilizar para muchas presentaciones; S3Sink mantiene
+un pool de conexiones y un pool de hilos compartidos entre ellas.
+"""
+
+import concurrent.futures
+import contextlib
+import datetime
+import hashlib
+import hmac
+import http.client
+import io
+import os
+import queue
+import secrets
+import threading
+import urllib.parse
+from xml.etree import ElementTree
+
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+def create_temp(directory, suffix=".tmp"):
+    """Crear un temporal exclusivo en `directory`; devuelve (fd, ruta)
+
+    A diferencia de mkstemp (modo 0600), se crea con 0666 y el kernel aplica
+    la umask, así que al reemplazar el destino queda con los permisos que
+    tendría con open().
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    for _ in range(100):
+        path = os.path.join(directory, f".{secrets.token_hex(6)}{suffix}")
+        try:
+            return os.open(path, flags, 0o666), path
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"no se pudo crear un temporal en {directory}")
+
+class SinkError(Exception):
+    """Error publicando una presentación en un sink"""
+
+class OutputSink:
+    """Interfaz común de los destinos de salida"""
+
+    def open(self, name):
+        """Context manager que entrega un stream binario escribible
+
+        El contenido se publica al salir sin excepción; si hay una
+        excepción se descarta lo escrito.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Liberar los recursos compartidos (conexiones, hilos)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class LocalFileSink(OutputSink):
+    """Archivos en un directorio local, reemplazados de forma atómica"""
+
+    def __init__(self, directory="."):
+        self.directory = directory
+
+    @contextlib.contextmanager
+    def open(self, name):
+        path = os.path.join(self.directory, name)
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = create_temp(directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+class MemorySink(OutputSink):
+    """Guarda cada presentación como bytes en el diccionario `files`"""
+
+    def __init__(self):
+        self.files = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def open(self, name):
+        buffer = io.BytesIO()
+        yield buffer
+        with self._lock:
+            self.files[name] = buffer.getvalue()
+
+# Errores de una conexión persistente que el servidor ya había cerrado
+_STALE_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+class _ConnectionPool:
+    """Pool de conexiones HTTP(S) persistentes hacia un mismo host"""
+
+    def __init__(self, endpoint, size, timeout):
+        url = urllib.parse.urlsplit(endpoint)
+        if url.scheme not in ("http", "https"):
+            raise ValueError(f"endpoint S3 inválido: {endpoint!r}")
+        self.host = url.netloc
+        self._factory = (http.client.HTTPSConnection if url.scheme == "https"
+                         else http.client.HTTPConnection)
+        self._timeout = timeout
+        self._idle = queue.LifoQueue(maxsize=size)
+
+    def request(self, method, path, body, headers):
+        """Enviar una petición y devolver (status, headers, cuerpo)
+
+        Solo se reenvía si falla una conexión reutilizada del pool porque el
+        servidor la cerró mientras estaba inactiva; cualquier otro error
+        se propaga sin reintentar (la petición pudo llegar a procesarse).
+        """
+        while True:
+            try:
+                conn, pooled = self._idle.get_nowait(), True
+            except queue.Empty:
+                conn, pooled = self._factory(self.host, timeout=self._timeout), False
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+            except _STALE_ERRORS:
+                conn.close()
+                if pooled:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            break
+        if response.will_close:
+            conn.close()
+        else:
+            try:
+                self._idle.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+        return response.status, response.headers, data
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+class S3Sink(OutputSink):
+    """Objetos en un endpoint compatible con S3 (AWS, MinIO, local_s3.py)
+
+    Los objetos de más de `part_size` bytes se suben por multipart: cada
+    parte se envía en segundo plano en cuanto se llena, mientras prs.save
+    sigue escribiendo el resto del paquete. Como mucho hay `max_workers`
+    partes en vuelo: si la subida va más lenta que el guardado, write()
+    espera en vez de acumular el paquete entero en memoria.
+    """
+
+    def __init__(self, endpoint, bucket, access_key=None, secret_key=None,
+                 region="us-east-1", part_size=S3_MIN_PART_SIZE, max_workers=4,
+                 pool_size=None, timeout=60):
+        self.endpoint = endpoint.rstrip("/")
+        self.bucket = bucket
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self.part_size = part_size
+        self._pool = _ConnectionPool(self.endpoint, pool_size or max_workers + 1, timeout)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix="s3-upload"
+        )
+        self._in_flight = threading.BoundedSemaphore(max_workers)
+
+    def open(self, name):
+        return _MultipartUpload(self, name.lstrip("/"))
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self._pool.close()
+
+    def request(self, method, key, query="", body=b"", headers=None, expect=200):
+        """Petición firmada con SigV4 sobre /bucket/key"""
+        path = "/" + urllib.parse.quote(f"{self.bucket}/{key}")
+        headers = dict(headers or {})
+        headers["Host"] = self._pool.host
+        headers["Content-Length"] = str(len(body))
+        headers["x-amz-content-sha256"] = hashlib.sha256(body).hexdigest()
+        if self.access_key:
+            _sign_v4(self, method, path, query, headers)
+        status, response_headers, data = self._pool.request(
+            method, f"{path}?{query}" if query else path, body, headers
+        )
+        if status != expect:
+            raise SinkError(f"{method} {path}?{query}: HTTP {status} {data[:200]!r}")
+        return response_headers, data
+
+def _sign_v4(sink, method, path, query, headers):
+    """Añadir las cabeceras de autenticación AWS Signature Version 4"""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    date = amz_date[:8]
+    headers["x-amz-date"] = amz_date
+
+    canonical_query = "&".join(sorted(
+        f"{urllib.parse.quote(k, safe='-_.~')}={urllib.parse.quote(v, safe='-_.~')}"
+        for k, v in urllib.parse.parse_qsl(query, keep_blank_values=True)
+    ))
+    signed = sorted(k.lower() for k in headers)
+    lowered = {k.lower(): str(v).strip() for k, v in headers.items()}
+    canonical_headers = "".join(f"{k}:{lowered[k]}\n" for k in signed)
+    signed_headers = ";".join(signed)
+    canonical_request = "\n".join([
+        method, path, canonical_query, canonical_headers, signed_headers,
+        headers["x-amz-content-sha256"],
+    ])
+
+    scope = f"{date}/{sink.region}/s3/aws4_request"
+    string_to_sign = "\n".join([
+        "AWS4-HMAC-SHA256", amz_date, scope,
+        hashlib.sha256(canonical_request.encode()).hexdigest(),
+    ])
+    key = ("AWS4" + sink.secret_key).encode()
+    for part in (date, sink.region, "s3", "aws4_request"):
+        key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+    signature = hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+    headers["Authorization"] = (
+        f"AWS4-HMAC-SHA256 Credential={sink.access_key}/{scope}, "
+        f"SignedHeaders={signed_headers}, Signature={signature}"
+    )
+
+class _MultipartUpload(io.BufferedIOBase):
+    """Stream de escritura que sube a S3 por partes concurrentes
+
+    No es seekable: zipfile lo detecta y escribe data descriptors, de modo
+    que el paquete se puede emitir de principio a fin sin volver atrás.
+    tell() devuelve los bytes escritos hasta el momento.
+    """
+
+    def __init__(self, sink, key):
+        super().__init__()
+        self._sink = sink
+        self._key = key
+        self._buffer = bytearray()
+        self._upload_id = None
+        self._parts = []
+        self._written = 0
+
+    def writable(self):
+        return True
+
+    def tell(self):
+        return self._written
+
+    def write(self, data):
+        if self.closed:
+            raise ValueError("escritura sobre un upload cerrado")
+        self._buffer += data
+        self._written += len(data)
+        while len(self._buffer) >= self._sink.part_size:
+            chunk = bytes(self._buffer[:self._sink.part_size])
+            del self._buffer[:self._sink.part_size]
+            self._submit(chunk)
+        return len(data)
+
+    def _submit(self, chunk):
+        if self._upload_id is None:
+            _, data = self._sink.request("POST", self._key, "uploads=")
+            self._upload_id = _find_text(data, "UploadId")
+        number = len(self._parts) + 1
+        query = urllib.parse.urlencode({"partNumber": number, "uploadId": self._upload_id})
+        self._sink._in_flight.acquire()
+        try:
+            future = self._sink._executor.submit(self._sink.request, "PUT", self._key, query, chunk)
+        except BaseException:
+            self._sink._in_flight.release()
+            raise
+        future.add_done_callback(lambda _: self._sink._in_flight.release())
+        self._parts.append(future)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    def commit(self):
+        """Subir lo pendiente y completar el objeto"""
+        if self._upload_id is None:
+            self._sink.request("PUT", self._key, body=bytes(self._buffer))
+        else:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+            self._buffer.clear()
+            try:
+                etags = [future.result()[0]["ETag"] for future in self._parts]
+            except BaseException:
+                self.abort()
+                raise
+            body = "".join(
+                f"<Part><PartNumber>{i}</PartNumber><ETag>{etag}</ETag></Part>"
+                for i, etag in enumerate(etags, 1)
+            )
+            body = f"<CompleteMultipartUpload>{body}</CompleteMultipartUpload>".encode()
+            query = urllib.parse.urlencode({"uploadId": self._upload_id})
+            self._sink.request("POST", self._key, query, body)
+        self.close()
+
+    def abort(self):
+        """Descartar las partes subidas"""
+        if self._upload_id is not None:
+            for future in self._parts:
+                future.cancel()
+            concurrent.futures.wait(self._parts)
+            query = urllib.parse.urlencode({"uploadId": self._upload_id})
+            try:
+                self._sink.request("DELETE", self._key, query, expect=204)
+            except (SinkError, OSError):
+                pass
+            self._upload_id = None
+        self.close()
+
+def _find_text(xml, tag):
+    for elm in ElementTree.fromstring(xml).iter():
+        if elm.tag.rsplit("}", 1)[-1] == tag:
+            return elm.text
+    raise SinkError(f"respuesta S3 sin <{tag}>: {xml[:200]!r}")
+
+def sink_for(output, **kwargs):
+    """Crear el sink adecuado para una ruta local o una URL s3://bucket/clave
+
+    Devuelve (sink, nombre). Para S3 el endpoint y las credenciales se toman
+    de AWS_ENDPOINT_URL, AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY y
+    AWS_REGION salvo que se pasen como argumentos.
+    """
+    url = urllib.parse.urlsplit(output)
+    if url.scheme == "s3":
+        kwargs.setdefault("endpoint", os.environ.get("AWS_ENDPOINT_URL", "https://s3.amazonaws.com"))
+        kwargs.setdefault("access_key", os.environ.get("AWS_ACCESS_KEY_ID"))
+        kwargs.setdefault("secret_key", os.environ.get("AWS_SECRET_ACCESS_KEY"))
+        kwargs.setdefault("region", os.environ.get("AWS_REGION", "us-east-1"))
+        return S3Sink(bucket=url.netloc, **kwargs), url.path.lstrip("/")
+    if url.scheme == "mem":
+        return MemorySink(), url.path.lstrip("/")
+    directory, name = os.path.split(output)
+    return LocalFileSink(directory or "."), name
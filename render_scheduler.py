@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Planificador asyncio de trabajos de renderizado
+
+Recibe trabajos con prioridad y deadline y ejecuta el trabajo de python-pptx
+(CPU) en un pool de procesos. Cada clase de prioridad tiene una cola acotada:
+cuando se llena, submit() espera (o falla con wait=False), lo que propaga la
+presión hacia quien encola. Un trabajo nuevo para la misma presentación
+reemplaza al anterior que aún no haya terminado; nunca se ejecutan a la vez
+dos trabajos de la misma presentación, así que uno obsoleto no puede
+sobrescribir la salida de uno más reciente.
+
+Uso:
+    python render_scheduler.py spec1.py spec2.py ... --output-dir salida/
+"""
+
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import dataclasses
+import itertools
+import json
+import math
+import os
+import statistics
+import time
+
+from deck_spec import load_slides
+from output_sinks import sink_for
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 10
+PRIORITY_NAMES = {"interactive": PRIORITY_INTERACTIVE, "batch": PRIORITY_BATCH}
+
+class QueueFull(Exception):
+    """La cola de esa prioridad está llena y se pidió no esperar"""
+
+class JobSuperseded(Exception):
+    """Llegó un trabajo más reciente para la misma presentación"""
+
+class DeadlineExceeded(Exception):
+    """El trabajo no llegó a ejecutarse antes de su deadline"""
+
+@dataclasses.dataclass(order=True)
+class RenderJob:
+    """Trabajo de renderizado; se ordena por prioridad, deadline y llegada"""
+
+    priority: int
+    deadline: float
+    seq: int
+    deck_id: str = dataclasses.field(compare=False)
+    spec_path: str = dataclasses.field(compare=False)
+    output: str = dataclasses.field(compare=False)
+    options: dict = dataclasses.field(compare=False, default_factory=dict)
+    submitted_at: float = dataclasses.field(compare=False, default=0.0)
+    state: str = dataclasses.field(compare=False, default="queued")
+    result: asyncio.Future = dataclasses.field(compare=False, default=None, repr=False)
+
+# Sinks por proceso de trabajo, para reutilizar conexiones entre presentaciones
+_WORKER_SINKS = {}
+
+def _render_job(spec_path, output, options):
+    """Ejecutado en el pool de procesos: cargar la spec y renderizarla"""
+    from create_presentation import render_deck
+
+    sink, name = sink_for(output)
+    key = (type(sink).__name__, output[:len(output) - len(name)])
+    if key in _WORKER_SINKS:
+        sink.close()
+        sink = _WORKER_SINKS[key]
+    else:
+        _WORKER_SINKS[key] = sink
+    return render_deck(load_slides(spec_path), name, sink=sink, **options)
+
+class RenderScheduler:
+    """Cola de prioridades con backpressure sobre un pool de procesos"""
+
+    def __init__(self, max_workers=None, max_queue=64, executor=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self._executor = executor
+        self._own_executor = executor is None
+        self._queue = asyncio.PriorityQueue()
+        self._slots = {}
+        self._latest = {}
+        self._active = {}
+        self._parked = {}
+        self._seq = itertools.count()
+        self._dispatchers = []
+        self._running = 0
+        self._depth = collections.Counter()
+        self._counters = collections.Counter()
+        self._waits = collections.defaultdict(lambda: collections.deque(maxlen=1000))
+
+    async def start(self):
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(self.max_workers)
+        self._dispatchers = [
+            asyncio.create_task(self._dispatch()) for _ in range(self.max_workers)
+        ]
+        return self
+
+    async def stop(self, drain=True):
+        """Parar los dispatchers; con drain=True antes se vacía la cola"""
+        if drain:
+            await self._queue.join()
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._dispatchers = []
+        pending = list(self._parked.values())
+        self._parked.clear()
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for job in pending:
+            self._finish(job, "cancelled", asyncio.CancelledError())
+        if self._own_executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop(drain=exc_info[0] is None)
+
+    async def submit(self, deck_id, spec_path, output, priority=PRIORITY_BATCH,
+                     deadline=None, wait=True, **options):
+        """Encolar un trabajo y devolver su RenderJob (await job.result)
+
+        deadline son segundos desde ahora; options se pasan a render_deck.
+        """
+        slots = self._slots.get(priority)
+        if slots is None:
+            slots = self._slots[priority] = asyncio.Semaphore(self.max_queue)
+        if not wait and slots.locked():
+            self._counters["rejected"] += 1
+            raise QueueFull(f"cola de prioridad {priority} llena ({self.max_queue})")
+        await slots.acquire()
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        job = RenderJob(
+            priority=priority,
+            deadline=now + deadline if deadline is not None else math.inf,
+            seq=next(self._seq),
+            deck_id=deck_id,
+            spec_path=spec_path,
+            output=output,
+            options=options,
+            submitted_at=now,
+            result=loop.create_future(),
+        )
+
+        previous = self._latest.get(deck_id)
+        if previous is not None and previous.state in ("queued", "running"):
+            self._finish(previous, "superseded", JobSuperseded(deck_id))
+        self._latest[deck_id] = job
+
+        self._counters["submitted"] += 1
+        self._depth[priority] += 1
+        self._queue.put_nowait(job)
+        return job
+
+    def _release(self, job):
+        """Liberar el hueco de cola de un trabajo que deja de estar encolado"""
+        if job.state == "queued":
+            self._slots[job.priority].release()
+            self._depth[job.priority] -= 1
+
+    def _finish(self, job, state, outcome):
+        """Cerrar un trabajo con un resultado o una excepción"""
+        if job.state in ("done", "failed", "superseded", "expired", "cancelled"):
+            return
+        self._release(job)
+        job.state = state
+        self._counters[state] += 1
+        if self._latest.get(job.deck_id) is job:
+            del self._latest[job.deck_id]
+        if job.result.done():
+            return
+        if isinstance(outcome, asyncio.CancelledError):
+            job.result.cancel()
+        elif isinstance(outcome, BaseException):
+            job.result.set_exception(outcome)
+        else:
+            job.result.set_result(outcome)
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._queue.get()
+            try:
+                if job.state != "queued":
+                    continue  # reemplazado mientras esperaba en la cola
+                now = loop.time()
+                if now > job.deadline:
+                    self._finish(job, "expired", DeadlineExceeded(job.deck_id))
+                    continue
+                if job.deck_id in self._active:
+                    # Esperar a que termine el trabajo en curso de esa misma
+                    # presentación; se reencola al acabar (ver abajo)
+                    self._parked[job.deck_id] = job
+                    continue
+
+                self._release(job)
+                job.state = "running"
+                self._active[job.deck_id] = job
+                self._waits[job.priority].append(now - job.submitted_at)
+                self._running += 1
+                try:
+                    summary = await loop.run_in_executor(
+                        self._executor, _render_job, job.spec_path, job.output, job.options
+                    )
+                except asyncio.CancelledError:
+                    # stop(drain=False): no dejar el resultado sin resolver
+                    self._finish(job, "cancelled", asyncio.CancelledError())
+                    raise
+                except Exception as e:
+                    self._finish(job, "failed", e)
+                else:
+                    # Si fue reemplazado durante la ejecución, el resultado se descarta
+                    self._finish(job, "done", summary)
+                finally:
+                    self._running -= 1
+                    del self._active[job.deck_id]
+                    # Reencolar antes de task_done para que join() lo espere
+                    parked = self._parked.pop(job.deck_id, None)
+                    if parked is not None and parked.state == "queued":
+                        self._queue.put_nowait(parked)
+            finally:
+                self._queue.task_done()
+
+    def metrics(self):
+        """Profundidad de cola, trabajos en curso, contadores y tiempos de espera"""
+        waits = {}
+        for priority, samples in self._waits.items():
+            ordered = sorted(samples)
+            if not ordered:
+                continue
+            waits[priority] = {
+                "count": len(ordered),
+                "mean_ms": statistics.fmean(ordered) * 1000,
+                "p50_ms": ordered[len(ordered) // 2] * 1000,
+                "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+                "max_ms": ordered[-1] * 1000,
+            }
+        return {
+            "queue_depth": {p: n for p, n in self._depth.items() if n},
+            "running": self._running,
+            "counters": dict(self._counters),
+            "wait_time": waits,
+        }
+
+async def _run_batch(specs, output_dir, priority, workers, max_queue, options):
+    start = time.perf_counter()
+    async with RenderScheduler(workers, max_queue) as scheduler:
+        jobs = []
+        for spec in specs:
+            deck_id = os.path.splitext(os.path.basename(spec))[0]
+            output = os.path.join(output_dir, deck_id + ".pptx")
+            jobs.append(await scheduler.submit(deck_id, spec, output, priority, **options))
+        results = await asyncio.gather(*(job.result for job in jobs), return_exceptions=True)
+        metrics = scheduler.metrics()
+
+    for spec, result in zip(specs, results):
+        if isinstance(result, BaseException):
+            print(f"❌ {spec}: {type(result).__name__}: {result}")
+        else:
+            print(f"✅ {result['output']}: {result['slides']} slides "
+                  f"({result['build_ms'] + result['save_ms']:.1f} ms)")
+    print(f"⏱️  {len(specs)} presentaciones en {time.perf_counter() - start:.2f} s")
+    print(json.dumps(metrics, indent=2))
+
+def main():
+    parser = argparse.ArgumentParser(description="Renderizar varias presentaciones en paralelo")
+    parser.add_argument("specs", nargs="+", help="archivos de contenido con la lista SLIDES")
+    parser.add_argument("--output-dir", default=".", help="directorio o prefijo s3:// de salida")
+    parser.add_argument("--priority", choices=sorted(PRIORITY_NAMES), default="batch")
+    parser.add_argument("--workers", type=int, help="procesos de renderizado (por defecto, CPUs)")
+    parser.add_argument("--max-queue", type=int, default=64, help="tamaño máximo de cada cola")
+    parser.add_argument("--optimize", action="store_true")
+    parser.add_argument("--baseline", action="store_true",
+                        help="con --optimize, comparar con un guardado normal (un save extra)")
+    parser.add_argument("--no-manifest", dest="manifest", action="store_false")
+    args = parser.parse_args()
+
+    asyncio.run(_run_batch(
+        args.specs, args.output_dir, PRIORITY_NAMES[args.priority], args.workers,
+        args.max_queue, {"optimize": args.optimize, "baseline": args.baseline,
+                                "manifest": args.manifest},
+    ))
+
+if __name__ == "__main__":
+    main()
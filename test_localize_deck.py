@@ -0,0 +1,45 @@
+"""
+Memoria de traducción con el traductor local StubTranslator
+"""
+
+import os
+import stat
+
+from localize_deck import StubTranslator, TranslationMemory, localize_deck
+
+SLIDES = [
+    ("title", "Inteligencia Artificial", "Autónoma"),
+    ("content", "Agentes", ["Planificación", ("Herramientas", 1), "Memoria"]),
+    ("content", "Resumen", ["Planificación", "Memoria"]),
+]
+
+def test_second_run_translates_only_new_or_changed_texts(tmp_path):
+    path = str(tmp_path / "memory.json")
+
+    translator = StubTranslator()
+    memory = TranslationMemory(path)
+    variants = localize_deck(SLIDES, ["en"], memory, translator)
+    memory.save()
+    localized, stats = variants["en"]
+    assert stats == {"unique": 7, "hits": 0, "translated": 7}
+    assert localized[1] == ("content", "[en] Agentes",
+                            ["[en] Planificación", ("[en] Herramientas", 1), "[en] Memoria"])
+
+    edited = SLIDES[:2] + [("content", "Resumen final", ["Planificación", "Memoria"])]
+    translator = StubTranslator()
+    memory = TranslationMemory(path)
+    variants = localize_deck(edited, ["en"], memory, translator)
+    assert variants["en"][1] == {"unique": 7, "hits": 6, "translated": 1}
+    assert translator.translated == 1
+    assert variants["en"][0][2][1] == "[en] Resumen final"
+
+def test_saved_memory_follows_the_umask(tmp_path):
+    path = str(tmp_path / "memory.json")
+    old_umask = os.umask(0o022)
+    try:
+        memory = TranslationMemory(path)
+        localize_deck(SLIDES, ["en"], memory, StubTranslator())
+        memory.save()
+    finally:
+        os.umask(old_umask)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
@@ -0,0 +1,79 @@
+"""
+S3Sink contra el S3 local en memoria (local_s3.py)
+"""
+
+import os
+
+import pytest
+
+from local_s3 import LocalS3Server
+from output_sinks import S3Sink
+
+@pytest.fixture
+def server():
+    server = LocalS3Server().start()
+    yield server
+    server.stop()
+
+@pytest.fixture
+def sink(server):
+    sink = S3Sink(server.endpoint, "decks", "key", "secret", part_size=64 * 1024,
+                  max_workers=2)
+    requests = []
+    request = sink.request
+
+    def recording_request(method, key, query="", *args, **kwargs):
+        requests.append((method, query.split("=")[0]))
+        return request(method, key, query, *args, **kwargs)
+
+    sink.request = recording_request
+    sink.requests = requests
+    yield sink
+    sink.close()
+
+def test_small_object_is_a_single_put(server, sink):
+    with sink.open("ia.pptx") as f:
+        f.write(b"pptx")
+        assert f.tell() == 4
+
+    assert server.objects[("decks", "ia.pptx")] == b"pptx"
+    assert sink.requests == [("PUT", "")]
+
+def test_large_object_is_uploaded_in_parts(server, sink):
+    data = os.urandom(5 * 64 * 1024 + 123)
+    with sink.open("ia.pptx") as f:
+        for i in range(0, len(data), 10000):
+            f.write(data[i:i + 10000])
+        assert f.tell() == len(data)
+
+    assert server.objects[("decks", "ia.pptx")] == data
+    assert [r for r in sink.requests if r[0] == "PUT"] == [("PUT", "partNumber")] * 6
+    assert sink.requests[0] == ("POST", "uploads")
+    assert sink.requests[-1] == ("POST", "uploadId")
+    assert server.uploads == {}
+
+def test_exception_aborts_the_upload(server, sink):
+    with pytest.raises(RuntimeError):
+        with sink.open("ia.pptx") as f:
+            f.write(os.urandom(3 * 64 * 1024))
+            raise RuntimeError("fallo a mitad del guardado")
+
+    assert ("decks", "ia.pptx") not in server.objects
+    assert server.uploads == {}
+    assert sink.requests[-1] == ("DELETE", "uploadId")
+
+def test_connections_are_reused_across_objects(server, sink):
+    created = []
+    factory = sink._pool._factory
+
+    def counting_factory(*args, **kwargs):
+        created.append(factory(*args, **kwargs))
+        return created[-1]
+
+    sink._pool._factory = counting_factory
+    for i in range(10):
+        with sink.open(f"deck{i}.pptx") as f:
+            f.write(os.urandom(3 * 64 * 1024))
+
+    assert len(server.objects) == 10
+    assert len(created) <= 3
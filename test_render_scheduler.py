@@ -0,0 +1,59 @@
+"""
+Regresiones del planificador de renderizado
+"""
+
+import asyncio
+import json
+import os
+
+from pptx import Presentation
+
+from deck_content import SLIDES
+from render_scheduler import JobSuperseded, RenderScheduler
+
+def _write_spec(path, slides):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"SLIDES = {slides!r}\n")
+
+async def _until_running(job):
+    while job.state == "queued":
+        await asyncio.sleep(0.01)
+    assert job.state == "running"
+
+def test_superseded_running_job_does_not_overwrite_newer_output(tmp_path):
+    big = tmp_path / "big.py"
+    small = tmp_path / "small.py"
+    _write_spec(big, SLIDES * 8)
+    _write_spec(small, SLIDES[:1])
+    output = str(tmp_path / "deck.pptx")
+
+    async def run():
+        async with RenderScheduler(max_workers=2) as scheduler:
+            stale = await scheduler.submit("deck", str(big), output)
+            await _until_running(stale)
+            fresh = await scheduler.submit("deck", str(small), output)
+            return await asyncio.gather(stale.result, fresh.result,
+                                        return_exceptions=True)
+
+    stale_result, fresh_result = asyncio.run(run())
+
+    assert isinstance(stale_result, JobSuperseded)
+    assert fresh_result["slides"] == 1
+    assert len(Presentation(output).slides) == 1
+    with open(os.path.join(tmp_path, "deck.manifest.json"), encoding="utf-8") as f:
+        assert json.load(f)["totals"]["slides"] == 1
+
+def test_stop_without_drain_resolves_running_job(tmp_path):
+    spec = tmp_path / "big.py"
+    _write_spec(spec, SLIDES * 10)
+
+    async def run():
+        scheduler = await RenderScheduler(max_workers=1).start()
+        job = await scheduler.submit("deck", str(spec), str(tmp_path / "deck.pptx"))
+        await _until_running(job)
+        await scheduler.stop(drain=False)
+        return job
+
+    job = asyncio.run(asyncio.wait_for(run(), timeout=60))
+    assert job.state == "cancelled"
+    assert job.result.cancelled()
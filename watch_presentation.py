@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Modo watch: regenera la presentación cada vez que cambia el contenido
+
+Mantiene el intérprete, python-pptx, la plantilla y la última presentación
+construida en memoria. Al editar el archivo de contenido solo se reconstruyen
+los slides modificados y el .pptx se reemplaza de forma atómica, junto con
+su manifiesto JSON.
+
+Uso:
+    python watch_presentation.py [--spec deck_content.py] [--output salida.pptx]
+        [--no-manifest]
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import io
+import os
+import select
+import struct
+import sys
+import time
+
+from build_manifest import ManifestRecorder, manifest_name, write_manifest
+from create_presentation import OUTPUT_PATH, build_presentation, update_presentation
+from deck_spec import load_slides
+from output_sinks import LocalFileSink
+
+# Constantes de <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")
+
+POLL_INTERVAL = 0.05
+DEBOUNCE = 0.005
+
+def save_atomic(prs, path, recorder=None):
+    """Guardar en un temporal del mismo directorio y reemplazar el destino
+
+    Con recorder se escribe después el manifiesto, también de forma atómica.
+    """
+    directory, name = os.path.split(path)
+    sink = LocalFileSink(directory or ".")
+    start = time.perf_counter()
+    with sink.open(name) as f:
+        prs.save(f)
+        output_bytes = f.tell()
+    if recorder is not None:
+        recorder.mark("save", time.perf_counter() - start)
+        with sink.open(manifest_name(name)) as f:
+            write_manifest(recorder.finish(prs, path, output_bytes), f)
+
+class InotifyWatcher:
+    """Espera cambios en un conjunto de archivos usando inotify (Linux)"""
+
+    def __init__(self, paths):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 falló")
+
+        # Se vigila el directorio y no el archivo: muchos editores guardan
+        # escribiendo un temporal y renombrándolo sobre el original.
+        self._names = {}
+        for path in paths:
+            directory, name = os.path.split(os.path.abspath(path))
+            wd = libc.inotify_add_watch(
+                self._fd, directory.encode(), IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+            )
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch falló: {directory}")
+            self._names.setdefault(wd, set()).add(name)
+
+    def wait(self):
+        """Bloquear hasta que cambie alguno de los archivos vigilados"""
+        while True:
+            select.select([self._fd], [], [])
+            if self._drain():
+                # Agrupar ráfagas de eventos de un mismo guardado
+                while select.select([self._fd], [], [], DEBOUNCE)[0]:
+                    self._drain()
+                return
+
+    def _drain(self):
+        changed = False
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+        offset = 0
+        while offset < len(data):
+            wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode()
+            offset += length
+            if name in self._names.get(wd, ()):
+                changed = True
+        return changed
+
+class PollingWatcher:
+    """Alternativa portable basada en mtime para sistemas sin inotify"""
+
+    def __init__(self, paths):
+        self._paths = list(paths)
+        self._mtimes = self._snapshot()
+
+    def _snapshot(self):
+        mtimes = {}
+        for path in self._paths:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                mtimes[path] = None
+        return mtimes
+
+    def wait(self):
+        while True:
+            time.sleep(POLL_INTERVAL)
+            mtimes = self._snapshot()
+            if mtimes != self._mtimes:
+                self._mtimes = mtimes
+                return
+
+def make_watcher(paths):
+    try:
+        return InotifyWatcher(paths)
+    except (OSError, AttributeError, TypeError):
+        return PollingWatcher(paths)
+
+def watch(spec_path, output_path, template=None, manifest=True):
+    """Bucle principal del modo watch"""
+    template_bytes = None
+    if template:
+        with open(template, "rb") as f:
+            template_bytes = f.read()
+
+    def full_build(slides):
+        stream = io.BytesIO(template_bytes) if template_bytes else None
+        recorder = ManifestRecorder() if manifest else None
+        return build_presentation(slides, stream, on_slide=recorder), recorder
+
+    slides = load_slides(spec_path)
+    start = time.perf_counter()
+    prs, recorder = full_build(slides)
+    if recorder is not None:
+        recorder.mark("build", time.perf_counter() - start)
+    save_atomic(prs, output_path, recorder)
+    print(f"✅ {output_path}: {len(prs.slides)} slides "
+          f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+    watcher = make_watcher([spec_path])
+    print(f"👀 Vigilando {spec_path} ({type(watcher).__name__}), Ctrl+C para salir")
+
+    while True:
+        watcher.wait()
+        try:
+            edited_ns = os.stat(spec_path).st_mtime_ns
+            start = time.perf_counter()
+            new_slides = load_slides(spec_path)
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            print(f"❌ Error cargando {spec_path}: {e}", file=sys.stderr)
+            continue
+
+        try:
+            if recorder is not None:
+                recorder.restart()
+            rebuilt = update_presentation(prs, slides, new_slides, on_slide=recorder)
+            if recorder is not None:
+                recorder.rebase(prs)
+        except Exception as e:
+            # El estado en memoria pudo quedar a medias: reconstruir todo
+            print(f"⚠️  Actualización incremental fallida ({e}), reconstruyendo",
+                  file=sys.stderr)
+            try:
+                prs, recorder = full_build(new_slides)
+            except Exception as e:
+                print(f"❌ Error construyendo la presentación: {e}", file=sys.stderr)
+                continue
+            rebuilt = len(new_slides)
+        slides = new_slides
+
+        if recorder is not None:
+            recorder.mark("build", time.perf_counter() - start)
+        save_atomic(prs, output_path, recorder)
+        build_ms = (time.perf_counter() - start) * 1000
+        latency_ms = (time.time_ns() - edited_ns) / 1e6
+        print(f"🔁 {rebuilt} slide(s) reconstruidos, {len(prs.slides)} en total | "
+              f"build+save {build_ms:.1f} ms | edición→archivo {latency_ms:.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--spec", default=os.path.join(os.path.dirname(__file__), "deck_content.py"),
+                        help="archivo de contenido con la lista SLIDES")
+    parser.add_argument("--output", default=OUTPUT_PATH, help="ruta del .pptx generado")
+    parser.add_argument("--template", help="plantilla .pptx base (por defecto la de python-pptx)")
+    parser.add_argument("--no-manifest", dest="manifest", action="store_false",
+                        help="no escribir el manifiesto JSON junto al .pptx")
+    args = parser.parse_args()
+
+    try:
+        watch(args.spec, args.output, args.template, args.manifest)
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()